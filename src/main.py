@@ -2,16 +2,35 @@ import argparse
 import asyncio
 import logging
 from datetime import datetime, date
+from typing import Optional
 from data_processor import DataProcessor
 from plotter import Plotter
 from wiki_api_client.api_client import WikiApiClient, WikiApiClientError
+from wiki_api_client.connection import PROFILES
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
-async def main(start_date: date, end_date: date):
-    api_client = WikiApiClient()
+OUTPUT_FORMATS = ("png", "html", "json")
+
+
+def positive_int(value: str) -> int:
+    """
+    Argparse type for positive integer arguments.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got '{value}'")
+    return number
+
+
+async def main(start_date: date, end_date: date, output_format: str = "png", chunk_size: Optional[int] = None,
+               connection_profile: str = "default"):
+    api_client = WikiApiClient(profile=connection_profile)
     logger.info("Fetching data from Wikimedia API...")
     try:
         articles = await api_client.fetch_top_articles_for_period(start_date, end_date)
@@ -29,14 +48,28 @@ async def main(start_date: date, end_date: date):
     df_period_top_articles = DataProcessor.filter_top_articles(df_all_months_top_articles)
 
     logger.info("Generating plot...")
-    Plotter(df_period_top_articles).plot_top_articles()
+    plotter = Plotter(df_period_top_articles)
+    if output_format == "html":
+        plotter.plot_top_articles_html(chunk_size=chunk_size)
+    elif output_format == "json":
+        plotter.export_payload(chunk_size=chunk_size)
+    else:
+        plotter.plot_top_articles()
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Fetch and plot Wikipedia top article statistics.")
     parser.add_argument("start", type=str, help="Start date in YYYYMMDD format")
     parser.add_argument("end", type=str, help="End date in YYYYMMDD format")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="png", dest="output_format",
+                        help="Output format: static PNG plot, interactive HTML plot or JSON payload")
+    parser.add_argument("--chunk-size", type=positive_int, default=None,
+                        help="Split the HTML/JSON payload into chunks of this many dates per zoom level")
+    parser.add_argument("--connection-profile", choices=list(PROFILES), default="default",
+                        help="Connection settings of the API client, e.g. 'burst' to pre-warm connections")
     args = parser.parse_args()
+    if args.chunk_size is not None and args.output_format == "png":
+        parser.error("--chunk-size is only supported with --format html or json")
 
     try:
         start_date = datetime.strptime(args.start, "%Y%m%d").date()
@@ -45,4 +78,4 @@ if __name__ == "__main__":
         logger.error("Invalid date format. Please use YYYYMMDD.")
         exit(1)
 
-    asyncio.run(main(start_date, end_date))
+    asyncio.run(main(start_date, end_date, args.output_format, args.chunk_size, args.connection_profile))
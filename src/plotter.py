@@ -1,9 +1,159 @@
+import json
 import logging
+from pathlib import Path
+from typing import Optional
+
 import matplotlib.pyplot as plt
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Top Wiki Articles</title>
+<style>
+body { font-family: sans-serif; margin: 20px; }
+#chart { border: 1px solid #ccc; }
+#legend { columns: 3; font-size: 13px; }
+</style>
+</head>
+<body>
+<h3 id="title"></h3>
+<label>Zoom level: <select id="level"></select></label>
+<label>From: <input type="date" id="from"></label>
+<label>To: <input type="date" id="to"></label>
+<div><svg id="chart" width="1200" height="700" xmlns="http://www.w3.org/2000/svg"></svg></div>
+<ul id="legend"></ul>
+<script>
+const payload = __PAYLOAD__;
+const colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+                "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"];
+const svgNS = "http://www.w3.org/2000/svg";
+const chunkCache = {};
+
+// Failed chunks are removed from the cache, so they are fetched again on the next update.
+function fetchChunk(path) {
+  if (!chunkCache[path]) {
+    chunkCache[path] = fetch(path)
+      .then(r => {
+        if (!r.ok) throw new Error("failed to load " + path + ": " + r.status + " " + r.statusText);
+        return r.json();
+      })
+      .catch(error => {
+        delete chunkCache[path];
+        throw error;
+      });
+  }
+  return chunkCache[path];
+}
+
+// A bucket (or a chunk) starts at its date and lasts until the start of the next one.
+function overlaps(start, nextStart, from, to) {
+  return start <= to && (nextStart === undefined || nextStart > from);
+}
+
+// Load the part of a level within [from, to]. Chunked levels fetch only the chunks overlapping the range.
+async function loadRange(name, from, to) {
+  const level = payload.levels[name];
+  let parts = [level];
+  if (level.chunks) {
+    const chunks = level.chunks.filter((chunk, i) => overlaps(chunk.start, (level.chunks[i + 1] || {}).start, from, to));
+    parts = await Promise.all(chunks.map(chunk => fetchChunk(chunk.path)));
+  }
+  const merged = {dates: [], series: payload.titles.map(() => [])};
+  for (const part of parts) {
+    merged.dates.push(...part.dates);
+    part.series.forEach((values, id) => merged.series[id].push(...values));
+  }
+  const visible = merged.dates.map((date, i) => overlaps(date, merged.dates[i + 1], from, to));
+  return {
+    dates: merged.dates.filter((date, i) => visible[i]),
+    series: merged.series.map(values => values.filter((v, i) => visible[i])),
+  };
+}
+
+function svgElement(tag, attrs) {
+  const element = document.createElementNS(svgNS, tag);
+  for (const [key, value] of Object.entries(attrs)) element.setAttribute(key, value);
+  return element;
+}
+
+function draw(level) {
+  const svg = document.getElementById("chart");
+  const width = svg.width.baseVal.value, height = svg.height.baseVal.value, pad = 50;
+  const maxViews = level.series.reduce((acc, values) => values.reduce((a, v) => Math.max(a, v), acc), 1);
+  const yMax = Math.max(1, Math.log10(maxViews));
+  const step = level.dates.length > 1 ? (width - 2 * pad) / (level.dates.length - 1) : 0;
+  const x = i => pad + i * step;
+  const y = v => height - pad - Math.log10(v) / yMax * (height - 2 * pad);
+
+  svg.replaceChildren();
+  level.series.forEach((values, id) => {
+    // Zero means "no data" and can't be drawn on a log scale.
+    const points = [];
+    values.forEach((v, i) => { if (v > 0) points.push(x(i).toFixed(1) + "," + y(v).toFixed(1)); });
+    const line = svgElement("polyline", {fill: "none", stroke: colors[id % colors.length], points: points.join(" ")});
+    const tooltip = svgElement("title", {});
+    tooltip.textContent = payload.titles[id];
+    line.appendChild(tooltip);
+    svg.appendChild(line);
+  });
+  if (level.dates.length) {
+    const first = svgElement("text", {x: pad, y: height - pad / 2});
+    first.textContent = level.dates[0];
+    const last = svgElement("text", {x: width - pad, y: height - pad / 2, "text-anchor": "end"});
+    last.textContent = level.dates[level.dates.length - 1];
+    const top = svgElement("text", {x: pad, y: pad - 10});
+    top.textContent = maxViews + " views (log scale)";
+    svg.append(first, last, top);
+  }
+}
+
+function showTitle() {
+  const stats = payload.stats;
+  document.getElementById("title").textContent =
+    "Top Wiki Articles (Mean Views: " + stats.mean_views.toFixed(2) +
+    ", Max Views: " + stats.max_views + ", Unique Articles: " + stats.unique_articles + ")";
+}
+
+function showError(error) {
+  document.getElementById("title").textContent = "Error: " + error.message +
+    (location.protocol === "file:" ? " (chunked plots must be served over HTTP)" : "");
+}
+
+function init() {
+  showTitle();
+  const legend = document.getElementById("legend");
+  payload.titles.forEach((title, id) => {
+    const item = document.createElement("li");
+    item.style.color = colors[id % colors.length];
+    item.textContent = title;
+    legend.appendChild(item);
+  });
+  const select = document.getElementById("level");
+  const from = document.getElementById("from");
+  const to = document.getElementById("to");
+  const names = Object.keys(payload.levels);
+  for (const name of names) select.add(new Option(name, name));
+  // Open the coarsest level, it's the smallest one to load.
+  select.value = names[names.length - 1];
+  from.value = from.min = to.min = payload.period.start;
+  to.value = from.max = to.max = payload.period.end;
+  const update = () => loadRange(select.value, from.value, to.value)
+    .then(level => { showTitle(); draw(level); })
+    .catch(showError);
+  for (const control of [select, from, to]) control.addEventListener("change", update);
+  update();
+}
+
+init();
+</script>
+</body>
+</html>
+"""
+
 
 class Plotter:
     df: pd.DataFrame
@@ -12,6 +162,14 @@ class Plotter:
     max_views_overall: int
     unique_articles_count: int
 
+    # Zoom level name -> pandas resample arguments, from the finest to the coarsest level.
+    # Every bucket is labelled by its start date. Coarser levels keep the payload small for long periods.
+    ZOOM_LEVELS = {
+        "day": dict(rule="D"),
+        "week": dict(rule="W-MON", label="left", closed="left"),
+        "month": dict(rule="MS"),
+    }
+
     def __init__(self, df: pd.DataFrame):
         """
         Initializes the Plotter with the provided DataFrame.
@@ -49,6 +207,108 @@ class Plotter:
 
         logger.info(f"Plot saved as '{output_file}'.")
 
+    def export_payload(self, output_file: str = "top_articles.json", chunk_size: Optional[int] = None) -> dict:
+        """
+        Export a compact, pre-aggregated JSON payload of the top articles views.
+
+        Titles are stored once in the "titles" table, series refer to them by their integer index.
+        Every zoom level from ZOOM_LEVELS holds the mean views of the days the article was in the top,
+        zero means the article was not in the top during the whole bucket.
+        :param output_file: Name of the JSON file to save the payload.
+        :param chunk_size: If set, each zoom level is split into chunks of at most chunk_size dates,
+                           saved as separate files next to the payload and referenced by relative path
+                           together with the start date of the chunk.
+        :return: The payload written to the output file.
+        """
+        self._prepare_data()
+        payload = self._build_payload(Path(output_file), chunk_size)
+
+        Path(output_file).write_text(json.dumps(payload, separators=(",", ":")))
+
+        logger.info(f"Payload saved as '{output_file}'.")
+        return payload
+
+    def plot_top_articles_html(self, output_file: str = "top_articles.html", chunk_size: Optional[int] = None):
+        """
+        Plot an interactive graph of the top articles views and save it as a standalone HTML file.
+
+        The pre-aggregated payload (see export_payload) is embedded into the page.
+        The page opens the coarsest zoom level. For chunked payloads it fetches only the chunks of the selected level
+        and date range, so in that case the file should be served over HTTP.
+        :param output_file: Name of the file to save the plot.
+        :param chunk_size: Optional number of dates per chunk, see export_payload.
+        """
+        self._prepare_data()
+        payload = self._build_payload(Path(output_file), chunk_size)
+
+        # Escape "</" so that titles can't close the script tag.
+        payload_json = json.dumps(payload, separators=(",", ":")).replace("</", "<\\/")
+        Path(output_file).write_text(HTML_TEMPLATE.replace("__PAYLOAD__", payload_json), encoding="utf-8")
+
+        logger.info(f"Interactive plot saved as '{output_file}'.")
+
+    def _build_payload(self, output_path: Path, chunk_size: Optional[int] = None) -> dict:
+        """
+        Build the payload from the prepared data, writing the chunk files if chunk_size is set.
+        :param output_path: Path of the main output file, chunks are saved in the "<name>_chunks" directory next to it.
+        :param chunk_size: Optional number of dates per chunk.
+        :return: The payload.
+        """
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        pivot_df = self.pivot_df.copy()
+        pivot_df.index = pd.to_datetime(pivot_df.index)
+
+        levels = {}
+        # Zero views mean the article was not in the top, so they are excluded from the means
+        present_df = pivot_df.where(pivot_df > 0)
+        for level_name, resample_kwargs in self.ZOOM_LEVELS.items():
+            resampled = present_df.resample(**resample_kwargs).mean().fillna(0).round().astype(int)
+            dates = resampled.index.strftime("%Y-%m-%d").tolist()
+            # One row per article, in the order of the titles table
+            series = resampled.T.values.tolist()
+
+            if chunk_size is None:
+                levels[level_name] = {"dates": dates, "series": series}
+            else:
+                levels[level_name] = {
+                    "points": len(dates),
+                    "chunks": self._write_chunks(output_path, level_name, dates, series, chunk_size),
+                }
+
+        return {
+            "titles": list(pivot_df.columns),
+            "period": {
+                "start": pivot_df.index.min().strftime("%Y-%m-%d"),
+                "end": pivot_df.index.max().strftime("%Y-%m-%d"),
+            },
+            "stats": {
+                "mean_views": float(self.overall_mean_views),
+                "max_views": int(self.max_views_overall),
+                "unique_articles": self.unique_articles_count,
+            },
+            "levels": levels,
+        }
+
+    @staticmethod
+    def _write_chunks(output_path: Path, level_name: str, dates: list, series: list, chunk_size: int) -> list[dict]:
+        """
+        Split a zoom level by dates into chunk files.
+        :return: Start dates and paths of the chunks, relative to the directory of the main output file.
+        """
+        chunks_dir = output_path.parent / f"{output_path.stem}_chunks"
+        chunks_dir.mkdir(parents=True, exist_ok=True)
+
+        chunks = []
+        for chunk_number, start in enumerate(range(0, len(dates), chunk_size)):
+            end = start + chunk_size
+            chunk = {"dates": dates[start:end], "series": [values[start:end] for values in series]}
+            chunk_file = chunks_dir / f"{level_name}_{chunk_number}.json"
+            chunk_file.write_text(json.dumps(chunk, separators=(",", ":")))
+            chunks.append({"start": dates[start], "path": f"{chunks_dir.name}/{chunk_file.name}"})
+        return chunks
+
     def _prepare_data(self):
         """
         Prepare data for the plot and calculate relevant statistics.
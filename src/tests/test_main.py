@@ -1,8 +1,9 @@
+import argparse
 from datetime import date, datetime
 
 import pytest
 
-from main import main
+from main import main, positive_int
 from wiki_api_client.api_client import WikiApiClient
 from wiki_api_client.types import TopArticleViewStats, TopArticlesViewStats
 from wiki_api_client.api_client import WikiApiClientError
@@ -67,3 +68,60 @@ async def test_main_api_failure(mocker, caplog):
         await main(start_date, end_date)
 
     assert "Failed to fetch data:" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_main_html_output(mocker):
+    """Test main function generates the interactive plot for the html output format."""
+    mock_api_client = mocker.AsyncMock(WikiApiClient)
+    mock_api_client.fetch_top_articles_for_period.return_value = [
+        TopArticlesViewStats(date=date(2025, 1, 25), articles=[TopArticleViewStats(title="Article A", views=100)])
+    ]
+    mocker.patch("main.WikiApiClient", return_value=mock_api_client)
+    mocker.patch("main.DataProcessor.filter_top_articles", return_value="filtered_df")
+    mock_plotter_instance = mocker.patch("main.Plotter").return_value
+
+    await main(start_date, end_date, output_format="html", chunk_size=30)
+
+    mock_plotter_instance.plot_top_articles_html.assert_called_once_with(chunk_size=30)
+    assert not mock_plotter_instance.plot_top_articles.called
+
+
+@pytest.mark.asyncio
+async def test_main_json_output(mocker):
+    """Test main function exports the payload for the json output format."""
+    mock_api_client = mocker.AsyncMock(WikiApiClient)
+    mock_api_client.fetch_top_articles_for_period.return_value = [
+        TopArticlesViewStats(date=date(2025, 1, 25), articles=[TopArticleViewStats(title="Article A", views=100)])
+    ]
+    mocker.patch("main.WikiApiClient", return_value=mock_api_client)
+    mocker.patch("main.DataProcessor.filter_top_articles", return_value="filtered_df")
+    mock_plotter_instance = mocker.patch("main.Plotter").return_value
+
+    await main(start_date, end_date, output_format="json")
+
+    mock_plotter_instance.export_payload.assert_called_once_with(chunk_size=None)
+    assert not mock_plotter_instance.plot_top_articles.called
+
+
+@pytest.mark.parametrize("value", ["1", "30"])
+def test_positive_int(value):
+    assert positive_int(value) == int(value)
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "abc"])
+def test_positive_int_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError, match="must be a positive integer"):
+        positive_int(value)
+
+
+@pytest.mark.asyncio
+async def test_main_connection_profile(mocker):
+    """Test main function creates the API client with the given connection profile."""
+    mock_api_client = mocker.AsyncMock(WikiApiClient)
+    mock_api_client.fetch_top_articles_for_period.return_value = []
+    mock_api_client_class = mocker.patch("main.WikiApiClient", return_value=mock_api_client)
+
+    await main(start_date, end_date, connection_profile="burst")
+
+    mock_api_client_class.assert_called_once_with(profile="burst")
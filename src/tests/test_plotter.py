@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch
 
 import pandas as pd
@@ -67,3 +68,83 @@ def test_plot_with_missing_dates(mock_savefig):
     assert plotter.pivot_df.loc["2023-01-02"].sum() == 0  # Missing date filled with 0
 
     mock_savefig.assert_called_once_with("missing_dates.png")
+
+
+def test_export_payload(plotter, tmp_path):
+    """Test the exported payload uses int IDs and is downsampled per zoom level."""
+    output_file = tmp_path / "payload.json"
+
+    payload = plotter.export_payload(str(output_file))
+
+    assert json.loads(output_file.read_text()) == payload
+    assert payload["titles"] == ["Article A", "Article B"]
+    assert payload["stats"]["max_views"] == 300
+    assert payload["stats"]["unique_articles"] == 2
+    assert payload["period"] == {"start": "2023-01-01", "end": "2023-01-03"}
+
+    day_level = payload["levels"]["day"]
+    assert day_level["dates"] == ["2023-01-01", "2023-01-02", "2023-01-03"]
+    assert day_level["series"] == [[100, 0, 300], [0, 200, 0]]
+
+    # Weeks are labelled by their starting Monday, days without the article in the top are not averaged
+    week_level = payload["levels"]["week"]
+    assert week_level["dates"] == ["2022-12-26", "2023-01-02"]
+    assert week_level["series"] == [[100, 300], [0, 200]]
+
+    month_level = payload["levels"]["month"]
+    assert month_level["dates"] == ["2023-01-01"]
+    assert month_level["series"] == [[200], [200]]
+
+
+def test_export_payload_chunked(plotter, tmp_path):
+    """Test the chunked payload references chunk files with the data split by dates."""
+    output_file = tmp_path / "payload.json"
+
+    payload = plotter.export_payload(str(output_file), chunk_size=2)
+
+    day_level = payload["levels"]["day"]
+    assert day_level["points"] == 3
+    assert day_level["chunks"] == [
+        {"start": "2023-01-01", "path": "payload_chunks/day_0.json"},
+        {"start": "2023-01-03", "path": "payload_chunks/day_1.json"},
+    ]
+
+    first_chunk = json.loads((tmp_path / day_level["chunks"][0]["path"]).read_text())
+    second_chunk = json.loads((tmp_path / day_level["chunks"][1]["path"]).read_text())
+    assert first_chunk == {"dates": ["2023-01-01", "2023-01-02"], "series": [[100, 0], [0, 200]]}
+    assert second_chunk == {"dates": ["2023-01-03"], "series": [[300], [0]]}
+
+
+def test_export_payload_invalid_chunk_size(plotter, tmp_path):
+    with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+        plotter.export_payload(str(tmp_path / "payload.json"), chunk_size=0)
+
+
+def test_plot_top_articles_html(tmp_path):
+    """Test the HTML plot embeds the payload and escapes closing tags in titles."""
+    data = {
+        "date": pd.to_datetime(["2023-01-01", "2023-01-02"]),
+        "title": ["</script>", "Article B"],
+        "views": [100, 200],
+    }
+    output_file = tmp_path / "plot.html"
+
+    Plotter(pd.DataFrame(data)).plot_top_articles_html(str(output_file))
+
+    html = output_file.read_text(encoding="utf-8")
+    assert "__PAYLOAD__" not in html
+    assert '"titles":["<\\/script>","Article B"]' in html
+    assert html.count("</script>") == 1
+
+
+def test_plot_top_articles_html_chunked(plotter, tmp_path):
+    """Test the chunked HTML plot references the chunk files and handles failed chunk loads."""
+    output_file = tmp_path / "plot.html"
+
+    plotter.plot_top_articles_html(str(output_file), chunk_size=2)
+
+    html = output_file.read_text(encoding="utf-8")
+    assert '"path":"plot_chunks/day_0.json"' in html
+    assert (tmp_path / "plot_chunks" / "day_0.json").exists()
+    assert "if (!r.ok)" in html
+    assert ".catch(showError)" in html
@@ -1,9 +1,10 @@
 import asyncio
 import json
 
-import aiohttp
 import logging
 from datetime import date, timedelta
+from typing import Optional, Union
+from wiki_api_client.connection import ConnectionProfile, LatencyTracker, PROFILES
 from wiki_api_client.types import TopArticlesViewStats, TopArticleViewStats
 
 logger = logging.getLogger(__name__)
@@ -19,15 +20,18 @@ class WikiApiClient:
     ENDPOINTS = dict(
         top_articles="pageviews/top/{project}/{access}/{year}/{month}/{day}"
     )
-    TIMEOUT = 60
-    MAX_CONCURRENT_REQUESTS = 100
 
-    def __init__(self, project="en.wikipedia", access="all-access", session=None):
+    def __init__(self, project="en.wikipedia", access="all-access", session=None,
+                 profile: Union[str, ConnectionProfile] = "default"):
         """
         Initializes the API client for Wikimedia with default settings.
         :param project: Project, defaults to "en.wikipedia"
         :param access: Access type, defaults to "all-access"
         :param session: Optional aiohttp session to be reused
+        :param profile: Connection profile or name of one of the predefined PROFILES, defaults to "default".
+                        If the session is provided, only the request concurrency of the profile is used:
+                        the connection settings, automatic warm-up and latency measurement apply
+                        to the client's own session only.
 
         Cautions:
             - Api client should be closed after use by calling the close method.
@@ -37,14 +41,21 @@ class WikiApiClient:
         self.project = project
         self.access = access
         self.common_kwargs = dict(project=self.project, access=self.access)
+        if isinstance(profile, str):
+            try:
+                profile = PROFILES[profile]
+            except KeyError:
+                raise WikiApiClientError(f"Unknown connection profile: {profile}")
+        self.profile = profile
+        self.latency = LatencyTracker()
+        self.warmed_up = False
         self.session_provided = session is not None
         if session:
             self.session = session
         else:
-            timeout = aiohttp.ClientTimeout(total=self.TIMEOUT)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = self.profile.create_session(trace_configs=[self.latency.trace_config])
 
-        self.semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self.semaphore = asyncio.Semaphore(self.profile.max_concurrent_requests)
 
     async def _get_url(self, endpoint, date: date = None, **kwargs):
         """
@@ -108,8 +119,34 @@ class WikiApiClient:
             logger.error(f"Failed to parse response: {e}")
             raise WikiApiClientError("Failed to parse response")
 
+    async def warm_up(self, connections: Optional[int] = None):
+        """
+        Open connections to the API host in advance, so they are reused by the following requests.
+        Failures are logged and ignored, as the requests will open the connections themselves.
+        :param connections: Number of connections to open, defaults to warm_up_connections of the profile
+        """
+        if connections is None:
+            connections = self.profile.warm_up_connections
+        if connections <= 0:
+            return
+
+        async def open_connection():
+            async with self.session.head(self.API_BASE_URL, headers=self.HEADERS,
+                                         trace_request_ctx=LatencyTracker.UNTRACKED) as response:
+                await response.read()
+
+        results = await asyncio.gather(*(open_connection() for _ in range(connections)), return_exceptions=True)
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.warning(f"Failed to warm up {len(failures)} of {connections} connections: {failures[0]}")
+        self.warmed_up = True
+
     async def fetch_top_articles_for_period(self, start_date: date, end_date: date) -> list[TopArticlesViewStats]:
-        tasks = [self.fetch_top_articles(date) for date in self._date_range(start_date, end_date)]
+        dates = list(self._date_range(start_date, end_date))
+        if not self.warmed_up and not self.session_provided:
+            # There is no use in more warm connections than requests
+            await self.warm_up(min(self.profile.warm_up_connections, len(dates)))
+        tasks = [self.fetch_top_articles(date) for date in dates]
         return await asyncio.gather(*tasks)
 
     def _date_range(self, start_date: date, end_date: date):
@@ -129,3 +166,13 @@ class WikiApiClient:
         """
         if not self.session_provided:
             await self.session.close()
+            for phase, stats in self.latency.summary().items():
+                message = f"Latency of {phase}: count={stats['count']}, errors={stats['errors']}"
+                if stats["count"]:
+                    message += (
+                        f", mean={stats['mean'] * 1000:.1f} ms, median={stats['median'] * 1000:.1f} ms, "
+                        f"max={stats['max'] * 1000:.1f} ms"
+                    )
+                logger.info(message)
+            if self.latency.reused_connections:
+                logger.info(f"Reused connections: {self.latency.reused_connections}")
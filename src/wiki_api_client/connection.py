@@ -0,0 +1,169 @@
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import aiohttp
+
+
+@dataclass(frozen=True)
+class ConnectionProfile:
+    """
+    Connector and session settings of the API client.
+
+    :param limit: Total number of simultaneous connections
+    :param limit_per_host: Number of simultaneous connections to the same host, 0 for no limit
+    :param keepalive_timeout: Seconds an idle connection is kept in the pool for reuse
+    :param ttl_dns_cache: Seconds resolved DNS records are cached, None to cache forever
+    :param total_timeout: Timeout of the whole request, including the queue for a free connection
+    :param connect_timeout: Timeout of establishing a new connection (TCP and TLS), None for no limit
+    :param read_timeout: Timeout of a single read from the socket, None for no limit
+    :param warm_up_connections: Number of connections opened before the first batch of requests
+    :param max_concurrent_requests: Number of requests the client sends at once. Should not exceed the connection
+                                    limits, otherwise the extra requests wait in the connector queue,
+                                    which counts toward the total timeout.
+    """
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15
+    ttl_dns_cache: Optional[int] = 10
+    total_timeout: float = 60
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    warm_up_connections: int = 0
+    max_concurrent_requests: int = 100
+
+    def create_session(self, trace_configs: Optional[list[aiohttp.TraceConfig]] = None) -> aiohttp.ClientSession:
+        """
+        Create an aiohttp session with the connector and timeouts of the profile.
+        :param trace_configs: Optional trace configs to attach to the session
+        :return: New aiohttp session, should be closed by the caller
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=self.total_timeout,
+            sock_connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, trace_configs=trace_configs)
+
+
+PROFILES = dict(
+    # aiohttp defaults with the total timeout only
+    default=ConnectionProfile(),
+    # Many requests to the single API host: all concurrent requests reuse the warmed up keep-alive connections
+    # and DNS is cached for a long time, so a burst of requests doesn't end up in a burst of TLS handshakes.
+    burst=ConnectionProfile(
+        limit_per_host=20,
+        keepalive_timeout=60,
+        ttl_dns_cache=600,
+        connect_timeout=10,
+        read_timeout=30,
+        warm_up_connections=20,
+        max_concurrent_requests=20,
+    ),
+    # Egress proxies limit the number of connections per client, so keep fewer of them but for longer.
+    proxy=ConnectionProfile(
+        limit=10,
+        limit_per_host=10,
+        keepalive_timeout=120,
+        ttl_dns_cache=600,
+        connect_timeout=20,
+        read_timeout=60,
+        warm_up_connections=10,
+        max_concurrent_requests=10,
+    ),
+)
+
+
+class LatencyTracker:
+    """
+    Collects the latency of request phases through aiohttp tracing.
+
+    Phases:
+        - queue: waiting for a free connection in the pool
+        - dns: resolving the host name (cache misses only)
+        - connect: establishing a new connection, including the TLS handshake
+        - request: from sending the request headers until the response headers are received
+        - total: the whole request, including all the phases above
+
+    Failed requests (connection errors, timeouts) are counted as errors of the phases they failed in.
+    Requests made with UNTRACKED as trace_request_ctx, e.g. connection warm-up, are excluded from the samples.
+    """
+    PHASES = ("queue", "dns", "connect", "request", "total")
+    UNTRACKED = {"untracked": True}
+
+    def __init__(self):
+        self.samples = {phase: [] for phase in self.PHASES}
+        self.errors = {phase: 0 for phase in self.PHASES}
+        self.reused_connections = 0
+
+        self.trace_config = aiohttp.TraceConfig()
+        self._register_phase("queue", self.trace_config.on_connection_queued_start,
+                             self.trace_config.on_connection_queued_end)
+        self._register_phase("dns", self.trace_config.on_dns_resolvehost_start,
+                             self.trace_config.on_dns_resolvehost_end)
+        self._register_phase("connect", self.trace_config.on_connection_create_start,
+                             self.trace_config.on_connection_create_end)
+        self._register_phase("request", self.trace_config.on_request_headers_sent,
+                             self.trace_config.on_request_end)
+        self._register_phase("total", self.trace_config.on_request_start,
+                             self.trace_config.on_request_end)
+        self.trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+        self.trace_config.on_request_exception.append(self._on_request_exception)
+
+    def _register_phase(self, phase: str, start_signal, end_signal):
+        """
+        Measure the time between the start and end signals of a phase within a request.
+        """
+        async def on_start(session, trace_config_ctx, params):
+            if not self._is_untracked(trace_config_ctx):
+                setattr(trace_config_ctx, phase, time.perf_counter())
+
+        async def on_end(session, trace_config_ctx, params):
+            started_at = getattr(trace_config_ctx, phase, None)
+            if started_at is not None:
+                self.samples[phase].append(time.perf_counter() - started_at)
+                # Phases still started when the request fails are the ones it failed in
+                delattr(trace_config_ctx, phase)
+
+        start_signal.append(on_start)
+        end_signal.append(on_end)
+
+    async def _on_connection_reused(self, session, trace_config_ctx, params):
+        if not self._is_untracked(trace_config_ctx):
+            self.reused_connections += 1
+
+    async def _on_request_exception(self, session, trace_config_ctx, params):
+        for phase in self.PHASES:
+            if getattr(trace_config_ctx, phase, None) is not None:
+                self.errors[phase] += 1
+                delattr(trace_config_ctx, phase)
+
+    @staticmethod
+    def _is_untracked(trace_config_ctx) -> bool:
+        trace_request_ctx = getattr(trace_config_ctx, "trace_request_ctx", None) or {}
+        return trace_request_ctx.get("untracked", False)
+
+    def summary(self) -> dict:
+        """
+        Summarize the collected latencies.
+        :return: Dictionary with count of successes, errors and mean, median and max latency in seconds
+                 for every measured phase. Latencies are None if the phase never succeeded.
+        """
+        return {
+            phase: dict(
+                count=len(samples),
+                errors=self.errors[phase],
+                mean=statistics.mean(samples) if samples else None,
+                median=statistics.median(samples) if samples else None,
+                max=max(samples) if samples else None,
+            )
+            for phase, samples in self.samples.items()
+            if samples or self.errors[phase]
+        }
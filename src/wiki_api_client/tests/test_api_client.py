@@ -1,8 +1,15 @@
+import asyncio
+
+import aiohttp
 import pytest
+import pytest_asyncio
 from datetime import date
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from aioresponses import aioresponses
 
 from wiki_api_client.api_client import WikiApiClient, WikiApiClientError
+from wiki_api_client.connection import ConnectionProfile
 from wiki_api_client.types import TopArticlesViewStats, TopArticleViewStats
 
 
@@ -154,3 +161,141 @@ async def test_date_range():
         date(2025, 1, 25),
         date(2025, 1, 26),
     ]
+
+
+@pytest.mark.asyncio
+async def test_unknown_connection_profile():
+    """Test the client rejects unknown connection profile names."""
+    with pytest.raises(WikiApiClientError, match="Unknown connection profile: unknown"):
+        WikiApiClient(profile="unknown")
+
+
+@pytest.mark.asyncio
+async def test_connection_profile_applied():
+    """Test the client session is created with the connector and timeouts of the profile."""
+    profile = ConnectionProfile(limit=10, limit_per_host=5, total_timeout=30, connect_timeout=5, read_timeout=15)
+
+    client = WikiApiClient(profile=profile)
+    connector = client.session.connector
+    timeout = client.session.timeout
+    await client.close()
+
+    assert connector.limit == 10
+    assert connector.limit_per_host == 5
+    assert timeout.total == 30
+    assert timeout.sock_connect == 5
+    assert timeout.sock_read == 15
+
+
+@pytest.mark.asyncio
+async def test_warm_up_before_fetch_for_period():
+    """Test connections are warmed up once before fetching the period, no more than the number of requests."""
+    start_date = date(2025, 1, 24)
+    end_date = date(2025, 1, 25)
+    profile = ConnectionProfile(warm_up_connections=3)
+
+    with aioresponses() as m:
+        m.head(WikiApiClient.API_BASE_URL, status=200, repeat=True)
+        for day in (24, 25):
+            m.get(
+                f"https://wikimedia.org/api/rest_v1/metrics/pageviews/top/en.wikipedia/all-access/2025/1/{day}",
+                payload={"items": [{"articles": [{"article": "Test_Article1", "rank": 1, "views": 1000}]}]},
+                repeat=True,
+            )
+
+        client = WikiApiClient(profile=profile)
+        await client.fetch_top_articles_for_period(start_date, end_date)
+        await client.fetch_top_articles_for_period(start_date, end_date)
+        await client.close()
+
+        head_requests = [key for key in m.requests if key[0] == "HEAD"]
+        assert len(m.requests[head_requests[0]]) == 2
+        assert client.warmed_up
+
+
+@pytest.mark.asyncio
+async def test_warm_up_failure_is_ignored(caplog):
+    """Test failed warm-up requests are logged and don't prevent fetching."""
+    with aioresponses() as m:
+        m.head(WikiApiClient.API_BASE_URL, exception=aiohttp.ClientConnectionError("refused"), repeat=True)
+
+        client = WikiApiClient()
+        await client.warm_up(connections=2)
+        await client.close()
+
+    assert any("Failed to warm up 2 of 2 connections" in record.message for record in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_no_warm_up_with_provided_session():
+    """Test the client doesn't send warm-up requests through the session provided by the caller."""
+    test_date = date(2025, 1, 25)
+    profile = ConnectionProfile(warm_up_connections=3, max_concurrent_requests=3)
+
+    with aioresponses() as m:
+        m.get(
+            "https://wikimedia.org/api/rest_v1/metrics/pageviews/top/en.wikipedia/all-access/2025/1/25",
+            payload={"items": [{"articles": [{"article": "Test_Article1", "rank": 1, "views": 1000}]}]},
+        )
+
+        async with aiohttp.ClientSession() as session:
+            client = WikiApiClient(session=session, profile=profile)
+            await client.fetch_top_articles_for_period(test_date, test_date)
+            await client.close()
+
+        assert not [key for key in m.requests if key[0] == "HEAD"]
+        assert not client.warmed_up
+
+
+@pytest_asyncio.fixture
+async def local_api(mocker):
+    """Local API server, the client base URL points to it. Set `delay` to slow down the responses."""
+    state = dict(delay=0)
+
+    async def handler(request):
+        await asyncio.sleep(state["delay"])
+        return web.json_response(
+            {"items": [{"articles": [{"article": "Test_Article1", "rank": 1, "views": 1000}]}]}
+        )
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    mocker.patch.object(WikiApiClient, "API_BASE_URL", str(server.make_url("/")))
+    yield state
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_warmed_up_connections_reused(local_api):
+    """Test requests reuse the warmed up connections instead of opening new ones."""
+    profile = ConnectionProfile(limit_per_host=2, warm_up_connections=2, max_concurrent_requests=2)
+
+    client = WikiApiClient(profile=profile)
+    result = await client.fetch_top_articles_for_period(date(2025, 1, 22), date(2025, 1, 25))
+    await client.close()
+
+    summary = client.latency.summary()
+    assert len(result) == 4
+    assert client.latency.reused_connections == 4
+    assert "connect" not in summary
+    assert summary["request"]["count"] == 4
+    assert summary["total"]["count"] == 4
+
+
+@pytest.mark.asyncio
+async def test_timeouts_counted_as_phase_errors(local_api):
+    """Test requests failing by the read timeout are counted as errors of the request phase."""
+    local_api["delay"] = 0.5
+    profile = ConnectionProfile(read_timeout=0.1)
+
+    client = WikiApiClient(profile=profile)
+    with pytest.raises(asyncio.TimeoutError):
+        await client.fetch_top_articles(date(2025, 1, 25))
+    await client.close()
+
+    summary = client.latency.summary()
+    assert summary["connect"]["count"] == 1
+    assert summary["request"] == dict(count=0, errors=1, mean=None, median=None, max=None)
+    assert summary["total"]["errors"] == 1
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import pytest
+
+from wiki_api_client.connection import LatencyTracker
+
+
+async def send(signal, trace_config_ctx):
+    for handler in signal:
+        await handler(None, trace_config_ctx, None)
+
+
+@pytest.mark.asyncio
+async def test_latency_tracker_measures_phases():
+    """Test the tracker records a sample per phase of each traced request."""
+    tracker = LatencyTracker()
+    trace_config = tracker.trace_config
+
+    for _ in range(2):
+        trace_config_ctx = SimpleNamespace()
+        await send(trace_config.on_request_start, trace_config_ctx)
+        await send(trace_config.on_connection_create_start, trace_config_ctx)
+        await send(trace_config.on_connection_create_end, trace_config_ctx)
+        await send(trace_config.on_request_headers_sent, trace_config_ctx)
+        await send(trace_config.on_request_end, trace_config_ctx)
+    await send(trace_config.on_connection_reuseconn, SimpleNamespace())
+
+    summary = tracker.summary()
+    assert set(summary) == {"connect", "request", "total"}
+    assert summary["request"]["count"] == 2
+    assert summary["connect"]["count"] == 2
+    assert summary["total"]["count"] == 2
+    assert summary["request"]["errors"] == 0
+    # The request phase starts after the connection is created, only the total phase includes it
+    assert summary["connect"]["max"] + summary["request"]["max"] <= summary["total"]["max"]
+    assert tracker.reused_connections == 1
+
+
+@pytest.mark.asyncio
+async def test_latency_tracker_counts_errors_of_failed_phases():
+    """Test a failed request is counted as an error of the phases it was in, not as a sample."""
+    tracker = LatencyTracker()
+    trace_config = tracker.trace_config
+    trace_config_ctx = SimpleNamespace()
+
+    await send(trace_config.on_request_start, trace_config_ctx)
+    await send(trace_config.on_dns_resolvehost_start, trace_config_ctx)
+    await send(trace_config.on_dns_resolvehost_end, trace_config_ctx)
+    await send(trace_config.on_connection_create_start, trace_config_ctx)
+    await send(trace_config.on_request_exception, trace_config_ctx)
+
+    summary = tracker.summary()
+    assert set(summary) == {"dns", "connect", "total"}
+    assert summary["dns"]["count"] == 1
+    assert summary["dns"]["errors"] == 0
+    assert summary["connect"] == dict(count=0, errors=1, mean=None, median=None, max=None)
+    assert summary["total"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_latency_tracker_ignores_end_without_start():
+    tracker = LatencyTracker()
+
+    await send(tracker.trace_config.on_dns_resolvehost_end, SimpleNamespace())
+
+    assert tracker.summary() == {}
+
+
+@pytest.mark.asyncio
+async def test_latency_tracker_skips_untracked_requests():
+    """Test requests marked as untracked, e.g. warm-up, don't affect the samples."""
+    tracker = LatencyTracker()
+    trace_config = tracker.trace_config
+    trace_config_ctx = SimpleNamespace(trace_request_ctx=LatencyTracker.UNTRACKED)
+
+    await send(trace_config.on_request_start, trace_config_ctx)
+    await send(trace_config.on_connection_create_start, trace_config_ctx)
+    await send(trace_config.on_connection_create_end, trace_config_ctx)
+    await send(trace_config.on_request_end, trace_config_ctx)
+    await send(trace_config.on_connection_reuseconn, trace_config_ctx)
+
+    assert tracker.summary() == {}
+    assert tracker.reused_connections == 0